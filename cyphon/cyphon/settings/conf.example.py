@@ -212,6 +212,12 @@ MONGODB = {
     'TIMEOUT': 20,
 }
 
+MONITORS = {
+    # Number of tasks to split each health check into. Monitors are
+    # assigned to a task by id, so each task checks a separate set.
+    'SHARD_COUNT': 1,
+}
+
 NOTIFICATIONS = {
     'PUSH_NOTIFICATION_KEY': '',
     'GCM_SENDER_ID': '',
@@ -25,6 +25,7 @@ Cyphon Celery tasks.
 
 # third party
 from django.apps import apps
+from django.conf import settings
 from django.db import close_old_connections
 
 # local
@@ -47,17 +48,44 @@ def get_new_mail():
     close_old_connections()
 
 
+def _get_monitor_shard_count():
+    """
+    Returns the number of shards to split a health check into, as given
+    by the MONITORS.SHARD_COUNT setting. Defaults to 1.
+    """
+    has_setting = hasattr(settings, 'MONITORS')
+    if has_setting:
+        return settings.MONITORS.get('SHARD_COUNT', 1)
+    return 1
+
+
 @app.task(name='tasks.run_health_check')
 def run_health_check():
     """
-    Gathers all active Monitors and updates their status.
+    Gathers all active Monitors and updates their status. If the
+    health check is split into more than one shard, queues a separate
+    task to update each shard instead.
     """
-    monitor_model = apps.get_model(app_label='monitors', model_name='monitor')
-    monitors = monitor_model.objects.find_enabled()
+    shard_count = _get_monitor_shard_count()
+    if shard_count > 1:
+        for shard_index in range(shard_count):
+            update_monitor_shard.delay(shard_index, shard_count)
+    else:
+        monitor_model = apps.get_model(app_label='monitors',
+                                       model_name='monitor')
+        monitor_model.objects.update_all_statuses()
+        close_old_connections()
 
-    for monitor in monitors:
-        monitor.update_status()
 
+@app.task(name='tasks.update_monitor_shard')
+def update_monitor_shard(shard_index, shard_count):
+    """
+    Takes the index of a shard and the total number of shards, and
+    updates the status of the active Monitors in that shard.
+    """
+    monitor_model = apps.get_model(app_label='monitors', model_name='monitor')
+    monitors = monitor_model.objects.find_shard(shard_index, shard_count)
+    monitor_model.objects.update_all_statuses(monitors)
     close_old_connections()
 
 
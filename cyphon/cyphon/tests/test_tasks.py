@@ -29,7 +29,7 @@ from django.test import TestCase
 from django_mailbox.models import Mailbox
 
 # local
-from cyphon.tasks import get_new_mail, run_health_check
+from cyphon.tasks import get_new_mail, run_health_check, update_monitor_shard
 from monitors.models import Monitor
 from tests.fixture_manager import get_fixtures
 
@@ -65,7 +65,39 @@ class RunHealthCheckTestCase(TestCase):
         enabled_monitors_count = Monitor.objects.find_enabled().count()
         assert all_monitors_count > enabled_monitors_count
 
-        with patch('monitors.models.Monitor.update_status') as mock_update:
+        with patch('monitors.models.Monitor.refresh_status',
+                   return_value=None) as mock_refresh:
             run_health_check()
-            self.assertEqual(mock_update.call_count, enabled_monitors_count)
+            self.assertEqual(mock_refresh.call_count, enabled_monitors_count)
+
+    def test_run_health_check_shards(self):
+        """
+        Tests the run_health_check task when the health check is split
+        into shards.
+        """
+        with self.settings(MONITORS={'SHARD_COUNT': 3}):
+            with patch('cyphon.tasks.update_monitor_shard.delay') as mock_delay:
+                run_health_check()
+                self.assertEqual(mock_delay.call_count, 3)
+                for (index, call) in enumerate(mock_delay.call_args_list):
+                    self.assertEqual(call[0], (index, 3))
+
+
+class UpdateMonitorShardTestCase(TestCase):
+    """
+    Tests the update_monitor_shard task.
+    """
+    fixtures = get_fixtures(['monitors'])
+
+    def test_update_monitor_shard(self):
+        """
+        Tests the update_monitor_shard task.
+        """
+        shard_count = Monitor.objects.find_shard(0, 2).count()
+        assert shard_count < Monitor.objects.find_enabled().count()
+
+        with patch('monitors.models.Monitor.refresh_status',
+                   return_value=None) as mock_refresh:
+            update_monitor_shard(0, 2)
+            self.assertEqual(mock_refresh.call_count, shard_count)
 
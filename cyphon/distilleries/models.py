@@ -27,6 +27,7 @@ Class                        Description
 """
 
 # standard library
+from collections import OrderedDict
 import logging
 
 # third party
@@ -103,6 +104,60 @@ class DistilleryManager(SelectRelatedManager, GetByNameMixin):
         annotated_qs = queryset.annotate(alert_cnt=models.Count('alerts'))
         return annotated_qs.filter(alert_cnt__gt=0)
 
+    def find_many(self, searches, page=1, page_size=_PAGE_SIZE):
+        """Find documents matching queries in several |Distilleries|.
+
+        The searches for Distilleries that use the same kind of
+        |Engine| are run together using that Engine's `find_many`
+        method, so Engines that can send several searches in one
+        request, such as Elasticsearch, make one request for all of
+        them.
+
+        Parameters
+        ----------
+        searches : |list| of |tuple|
+            A list of (distillery, query, sorter) tuples, where query
+            is an |EngineQuery| and sorter is a |Sorter| or |None|.
+
+        page : int
+            The page of results to return for each search.
+
+        page_size : int
+            The number of documents per page of results.
+
+        Returns
+        -------
+        |OrderedDict|
+            An OrderedDict that maps each Distillery to its search
+            result, in the order of the searches. Each search result
+            is a dictionary with keys 'count' and 'results', like those
+            returned by the |Distillery|'s
+            :meth:`~Distillery.find` method, or |None| if the search
+            failed.
+
+        """
+        results = OrderedDict(
+            (distillery, None) for (distillery, _, _) in searches
+        )
+        groups = OrderedDict()
+        for (distillery, query, sorter) in searches:
+            engine = distillery.engine
+            groups.setdefault(type(engine), []).append(
+                (distillery, (engine, query, sorter)))
+
+        for group in groups.values():
+            engine_searches = [search for (_, search) in group]
+
+            # find_many is a classmethod, so any engine in the group can
+            # be used to call it
+            engine = engine_searches[0][0]
+            group_results = engine.find_many(engine_searches, page=page,
+                                             page_size=page_size) or []
+
+            for ((distillery, _), result) in zip(group, group_results):
+                results[distillery] = result
+        return results
+
 
 class Distillery(models.Model):
     """Coordinate the storage, retrieval, and display of documents.
@@ -80,6 +80,45 @@ class DistilleryManagerTestCase(TestCase):
         have_alerts = Distillery.objects.have_alerts()
         self.assertEqual(have_alerts.count(), 3)
 
+    @patch('engines.elasticsearch.engine.ElasticsearchEngine.find_many')
+    @patch('engines.mongodb.engine.MongoDbEngine.find_many')
+    def test_find_many(self, mock_mongo_find, mock_es_find):
+        """
+        Tests the find_many method.
+        """
+        mongo_results = [{'count': 1, 'results': [{'_id': 1}]},
+                         {'count': 0, 'results': []}]
+        es_results = [{'count': 2, 'results': [{'_id': 2}]}]
+        mock_mongo_find.return_value = mongo_results
+        mock_es_find.return_value = es_results
+
+        distilleries = [Distillery.objects.get(pk=pk) for pk in [1, 3, 2]]
+        query = Mock()
+        searches = [(distillery, query, None) for distillery in distilleries]
+        actual = Distillery.objects.find_many(searches, page=1, page_size=1)
+
+        # searches are grouped by Engine class
+        self.assertEqual(mock_mongo_find.call_count, 1)
+        self.assertEqual(mock_es_find.call_count, 1)
+        mongo_searches = mock_mongo_find.call_args[0][0]
+        self.assertEqual(len(mongo_searches), 2)
+        self.assertEqual(mock_mongo_find.call_args[1],
+                         {'page': 1, 'page_size': 1})
+
+        self.assertEqual(list(actual.keys()), distilleries)
+        self.assertEqual(list(actual.values()),
+                         [mongo_results[0], es_results[0], mongo_results[1]])
+
+    @patch('engines.mongodb.engine.MongoDbEngine.find_many',
+           return_value=None)
+    def test_find_many_failed(self, mock_find):
+        """
+        Tests the find_many method when an Engine's search fails.
+        """
+        distillery = Distillery.objects.get(pk=1)
+        actual = Distillery.objects.find_many([(distillery, Mock(), None)])
+        self.assertEqual(actual[distillery], None)
+
 
 class DistilleryTestCaseMixin(object):
     """
@@ -387,6 +387,23 @@ class ElasticsearchEngine(Engine):
 
         return ELASTICSEARCH.search(**params)
 
+    @staticmethod
+    def _get_find_params(query, sorter=None):
+        """Create query parameters for finding docs.
+
+        Takes an |EngineQuery| and an optional |Sorter| and returns a
+        dictionary of Elasticsearch query and sort parameters.
+        """
+        es_query = es_queries.ElasticsearchQuery(query.subqueries,
+                                                 query.joiner)
+        params = es_query.params
+
+        if sorter:
+            elastic_sorter = es_sorter.ElasticsearchSorter(sorter.sort_list)
+            params.update(elastic_sorter.params)
+
+        return params
+
     @catch_connection_error
     @wait_for_status('yellow')
     def find_by_id(self, doc_ids):
@@ -442,14 +459,7 @@ class ElasticsearchEngine(Engine):
 
         """
         offset = self.get_offset(page, page_size)
-        es_query = es_queries.ElasticsearchQuery(query.subqueries,
-                                                 query.joiner)
-        params = es_query.params
-
-        if sorter:
-            elastic_sorter = es_sorter.ElasticsearchSorter(sorter.sort_list)
-            params.update(elastic_sorter.params)
-
+        params = self._get_find_params(query, sorter)
         results = self._get_search_results(
             params,
             source=self.field_names,
@@ -458,6 +468,75 @@ class ElasticsearchEngine(Engine):
         )
         return es_results.get_results_and_count(results)
 
+    @classmethod
+    @catch_connection_error
+    @wait_for_status('yellow')
+    def find_many(cls, searches, page=1, page_size=PAGE_SIZE):
+        """Find documents matching several queries.
+
+        Runs a set of searches, each of which can be handled by a
+        different ElasticsearchEngine, in a single multi-search request.
+
+        Parameters
+        ----------
+        searches : |list| of |tuple|
+            A list of (engine, query, sorter) tuples, where `engine` is
+            an ElasticsearchEngine, `query` is an |EngineQuery|, and
+            `sorter` is a |Sorter| or |None|.
+
+        page : int
+            The page of results to return for each search.
+
+        page_size : int
+            The number of documents per page of results.
+
+        Returns
+        -------
+        |list| of |dict| or |None|
+            The results of each search, in the same order as `searches`.
+            Each is a dictionary with keys 'count' and 'results', as
+            returned by :meth:`~ElasticsearchEngine.find`. Returns |None|
+            if a connection to Elasticsearch can't be established.
+
+        Raises
+        ------
+        :exc:`~elasticsearch.exceptions.TransportError`
+            If any of the searches fails, as :meth:`~ElasticsearchEngine.find`
+            would for the same search.
+
+        """
+        if not searches:
+            return []
+
+        offset = cls.get_offset(page, page_size)
+        body = []
+        for (engine, query, sorter) in searches:
+            header = engine._params_for_search
+            params = engine._get_find_params(query, sorter)
+            params.update({
+                '_source': engine.field_names,
+                'size': page_size,
+                'from': offset,
+            })
+            body.append({
+                'index': header['index'],
+                'type': header['doc_type'],
+                'ignore_unavailable': True,
+            })
+            body.append(params)
+
+        data = ELASTICSEARCH.msearch(body=body)
+
+        results = []
+        for response in data['responses']:
+            if 'error' in response:
+                raise elasticsearch.exceptions.TransportError(
+                    response.get('status', 'N/A'),
+                    response['error']
+                )
+            results.append(es_results.get_results_and_count(response))
+        return results
+
     @catch_connection_error
     @wait_for_status('yellow')
     def filter_ids(self, doc_ids, fields, value):
@@ -28,7 +28,7 @@ except ImportError:
     from mock import call, patch
 
 # third party
-from elasticsearch.exceptions import ConnectionError
+from elasticsearch.exceptions import ConnectionError, TransportError
 from testfixtures import LogCapture
 
 # local
@@ -116,6 +116,39 @@ class ElasticsearchTestCase(ElasticsearchBaseTestCase):
         self.assertTrue(name.startswith('test_index_'))
         self.assertTrue(name.endswith('.test_docs'))
 
+    def test_find_many_error(self):
+        """
+        Tests that the find_many method raises an error when one of its
+        searches fails.
+        """
+        error = {'type': 'search_phase_execution_exception',
+                 'reason': 'all shards failed'}
+        responses = {'responses': [
+            {'hits': {'total': 0, 'hits': []}},
+            {'error': error, 'status': 400},
+        ]}
+        searches = [(self.engine, None, None), (self.engine, None, None)]
+        with patch('engines.elasticsearch.engine.ELASTICSEARCH.msearch',
+                   return_value=responses):
+            with patch.object(ElasticsearchEngine, '_get_find_params',
+                              return_value={}):
+                with self.assertRaises(TransportError) as context:
+                    self.engine.find_many(searches)
+        self.assertEqual(context.exception.status_code, 400)
+        self.assertEqual(context.exception.error, error)
+
+    @patch('engines.elasticsearch.engine.ELASTICSEARCH.msearch',
+           side_effect=ConnectionError())
+    def test_find_many_cannot_connect(self, mock_msearch):
+        """
+        Tests that the find_many method returns None when it can't
+        connect to Elasticsearch.
+        """
+        searches = [(self.engine, None, None)]
+        with patch.object(ElasticsearchEngine, '_get_find_params',
+                          return_value={}):
+            self.assertEqual(self.engine.find_many(searches), None)
+
 
 class CatchConnectionError(ElasticsearchBaseTestCase):
     """
@@ -179,6 +179,42 @@ class Engine(BaseClass):
         """
         return self.raise_method_not_implemented()
 
+    @classmethod
+    def find_many(cls, searches, page=1, page_size=PAGE_SIZE):
+        """Find documents matching several queries.
+
+        Runs a set of searches, each of which can be handled by a
+        different instance of the Engine class.
+
+        Parameters
+        ----------
+        searches : |list| of |tuple|
+            A list of (engine, query, sorter) tuples, where `engine` is
+            an instance of the Engine class, `query` is an |EngineQuery|,
+            and `sorter` is a |Sorter| or |None|.
+
+        page : int
+            The page of results to return for each search.
+
+        page_size : int
+            The number of documents per page of results.
+
+        Returns
+        -------
+        |list| of |dict|
+            The results of each search, in the same order as `searches`,
+            in the format returned by :meth:`~Engine.find`.
+
+        Notes
+        -----
+        This method runs each search separately. It should be overridden
+        in derived classes whose data stores can run several searches
+        in a single request.
+
+        """
+        return [engine.find(query, sorter, page, page_size)
+                for (engine, query, sorter) in searches]
+
     def filter_ids(self, doc_ids, fields, value):
         """Find the ids of documents that match a value.
 
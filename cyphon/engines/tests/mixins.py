@@ -957,6 +957,28 @@ class FilterTestCaseMixin(object):
         self.assertEqual(len(docs), 1)
         self.assertEqual(docs[0]['user']['screen_name'], 'john')
 
+    def test_find_many(self):
+        """
+        Tests that find_many returns the same results as find.
+        """
+        sorter = Sorter([
+            SortParam(
+                field_name='user.age',
+                field_type='IntegerField',
+                order='DESC'
+            )
+        ])
+        and_query = EngineQuery(self.fieldsets, 'AND')
+        or_query = EngineQuery(self.fieldsets, 'OR')
+        searches = [
+            (self.engine, and_query, None),
+            (self.engine, or_query, sorter),
+        ]
+        results = self.engine.find_many(searches, page=1, page_size=2)
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0], self.engine.find(and_query, None, 1, 2))
+        self.assertEqual(results[1], self.engine.find(or_query, sorter, 1, 2))
+
     def test_filter_ids_analyzed(self):
         """
         Tests the filter_ids method.
@@ -137,6 +137,14 @@ class EngineTestCase(EngineBaseTestCase):
         with self.assertRaises(NotImplementedError):
             self.engine.find({'_id': 'xyz'})
 
+    def test_find_many(self):
+        """
+        Tests the find_many method.
+        """
+        self.assertEqual(Engine.find_many([]), [])
+        with self.assertRaises(NotImplementedError):
+            Engine.find_many([(self.engine, {'_id': 'xyz'}, None)])
+
     def test_filter_ids(self):
         """
         Tests the find_by_id method.
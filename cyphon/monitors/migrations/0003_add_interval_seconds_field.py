@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.15 on 2019-03-04 10:12
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+# copied here so the migration doesn't change if the app's time
+# conversions do
+SECONDS_PER_UNIT = {
+    's': 1,
+    'm': 60,
+    'h': 3600,
+    'd': 86400,
+}
+
+
+def populate_interval_seconds(apps, schema_editor):
+    """
+    Populate interval_seconds for existing Monitors, with one UPDATE
+    for each distinct time interval.
+    """
+    Monitor = apps.get_model('monitors', 'Monitor')
+    intervals = Monitor.objects.order_by().values_list('time_interval',
+                                                       'time_unit')
+    for (time_interval, time_unit) in intervals.distinct():
+        Monitor.objects.filter(
+            time_interval=time_interval,
+            time_unit=time_unit
+        ).update(
+            interval_seconds=time_interval * SECONDS_PER_UNIT[time_unit]
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitors', '0002_auto_20170602_0914'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='monitor',
+            name='interval_seconds',
+            field=models.IntegerField(default=0, editable=False),
+            preserve_default=False,
+        ),
+        migrations.RunPython(
+            populate_interval_seconds,
+            reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -21,12 +21,16 @@ at the expected rate.
 """
 
 # standard library
+from collections import OrderedDict
 from datetime import timedelta
 import json
+import logging
 
 # third party
-from django.db import models
+from django.db import connections, models
+from django.db.models.functions import Cast
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
 
 # local
@@ -43,18 +47,175 @@ from engines.queries import EngineQuery
 from engines.sorter import SortParam, Sorter
 import utils.dateutils.dateutils as dt
 
+_LOGGER = logging.getLogger(__name__)
+
+_BATCH_SIZE = 500
+
 
 class MonitorManager(AlarmManager):
     """
 
     """
 
+    _STATUS_FIELDS = [
+        'status',
+        'last_healthy',
+        'last_active_distillery',
+        'last_saved_doc',
+        'last_updated',
+    ]
+
+    def get_queryset(self):
+        """
+        Overrides the default get_queryset method to select each
+        Monitor's last active Distillery.
+        """
+        default_queryset = super(MonitorManager, self).get_queryset()
+        return default_queryset.select_related('last_active_distillery')
+
+    @staticmethod
+    def _get_distilleries_prefetch():
+        """
+        Returns a Prefetch for Monitors' Distilleries that also selects
+        the related objects used to search them. These include the
+        Containers' Bottles and Labels, and their fields, which are
+        used to build the schema for each Distillery's Engine.
+        """
+        distilleries = Distillery.objects.select_related(
+            'collection__warehouse',
+            'container__bottle',
+            'container__label',
+            'container__taste'
+        ).prefetch_related(
+            'container__bottle__fields',
+            'container__label__fields'
+        )
+        return models.Prefetch('distilleries', queryset=distilleries)
+
+    def _prefetch_distilleries(self, queryset):
+        """
+        Takes a QuerySet of Monitors and returns it with the Monitors'
+        Distilleries prefetched, along with the related objects used
+        to search them.
+        """
+        return queryset.prefetch_related(self._get_distilleries_prefetch())
+
     def find_relevant(self, distillery):
         """
 
         """
         active_monitors = self.find_enabled()
-        return active_monitors.filter(distilleries=distillery)
+        relevant_monitors = active_monitors.filter(distilleries=distillery)
+        return self._prefetch_distilleries(relevant_monitors)
+
+    def _get_value(self, monitor, field):
+        """
+        Takes a Monitor and a model field, and returns an expression for
+        the Monitor's value for that field.
+        """
+        value = models.Value(getattr(monitor, field.attname),
+                             output_field=field)
+
+        # PostgreSQL can't infer the type of a CASE whose values are all
+        # NULL, so the values are cast to the field's type
+        if connections[self.db].vendor == 'postgresql':
+            return Cast(value, output_field=field)
+
+        return value
+
+    def _bulk_update(self, monitors, field_names, batch_size=_BATCH_SIZE):
+        """
+        Takes a list of saved Monitors and a list of field names, and
+        writes the Monitors' values for those fields to the database,
+        using one UPDATE query per batch of Monitors. Returns None.
+
+        Django 1.11 has no QuerySet.bulk_update(), so this builds the
+        same CASE expressions that method uses.
+        """
+        fields = [self.model._meta.get_field(name) for name in field_names]
+        for start in range(0, len(monitors), batch_size):
+            batch = monitors[start:start + batch_size]
+            updates = {}
+            for field in fields:
+                whens = [
+                    models.When(pk=monitor.pk,
+                                then=self._get_value(monitor, field))
+                    for monitor in batch
+                ]
+                updates[field.attname] = models.Case(*whens,
+                                                     output_field=field)
+            pks = [monitor.pk for monitor in batch]
+            self.filter(pk__in=pks).update(**updates)
+
+    def find_shard(self, shard_index, shard_count):
+        """
+        Takes the index of a shard and the total number of shards, and
+        returns a QuerySet of the enabled Monitors in that shard. Each
+        Monitor belongs to the shard given by its id modulo the number
+        of shards, so the shards don't overlap.
+        """
+        enabled_monitors = self.find_enabled()
+        shard = models.F('id') % shard_count
+        return enabled_monitors.annotate(shard=shard).filter(shard=shard_index)
+
+    def update_all_statuses(self, queryset=None):
+        """
+        Takes an optional QuerySet of Monitors, and updates the status
+        of each of its Monitors, or of every enabled Monitor if no
+        QuerySet is given. Creates Alerts where appropriate. Instead of
+        saving each Monitor, writes the status fields for all of them in
+        batches. Only the status fields that changed for at least one
+        Monitor are written, along with last_updated. Every Monitor is
+        checked as of the same time. The last Alert info of a Monitor is
+        saved separately, by Monitor._save_alert_info(). If a Monitor's
+        status can't be checked, the error is logged and the Monitor is
+        left as it was, so the other Monitors are still updated.
+
+        The statuses are written before any Alerts are saved, so an
+        Alert that can't be saved doesn't keep the status changes from
+        being recorded. Errors saving an Alert are logged, and the
+        remaining Alerts are still saved. Returns None.
+        """
+        now = timezone.now()
+        if queryset is None:
+            queryset = self.find_enabled()
+        monitors = []
+        pending_alerts = []
+        for monitor in self._prefetch_distilleries(queryset):
+            try:
+                alert = monitor.refresh_status(now)
+
+            # different backends may throw different exceptions
+            except Exception as error:  # pylint: disable=W0703
+                _LOGGER.exception('Error checking the status of Monitor '
+                                  '"%s": %s', monitor, error)
+                continue
+
+            monitor.last_updated = now
+            monitors.append(monitor)
+            if alert:
+                pending_alerts.append((monitor, alert))
+
+        dirty_fields = set(['last_updated'])
+        for monitor in monitors:
+            dirty_fields.update(monitor._get_dirty_fields())
+
+        field_names = [name for name in self._STATUS_FIELDS
+                       if name in dirty_fields]
+        self._bulk_update(monitors, field_names)
+
+        # Alerts are saved one at a time rather than with bulk_create(),
+        # since Alert.save() fills in the Alert's data and muzzle_hash,
+        # and post_save receivers send notifications and tag the Alert
+        for (monitor, alert) in pending_alerts:
+            try:
+                alert.save()
+                monitor._save_alert_info(alert)
+
+            # different backends may throw different exceptions
+            except Exception as error:  # pylint: disable=W0703
+                _LOGGER.exception('Error saving an Alert for Monitor '
+                                  '"%s": %s', monitor, error)
 
 
 class Monitor(Alarm):
@@ -82,6 +243,10 @@ class Monitor(Alarm):
         The time units for the time_interval. Possible values are
         constrained to TIME_UNIT_CHOICES.
 
+    interval_seconds : int
+        The time_interval converted to seconds. This is calculated from
+        the time_interval and time_unit whenever the Monitor is saved.
+
     alerts_enabled : bool
         If True, the Monitor is allowed to generate Alerts.
 
@@ -133,6 +298,7 @@ class Monitor(Alarm):
     )
     time_interval = models.IntegerField()
     time_unit = models.CharField(max_length=3, choices=TIME_UNIT_CHOICES)
+    interval_seconds = models.IntegerField(editable=False)
     alerts_enabled = models.BooleanField(default=True)
     repeating_alerts = models.BooleanField(default=False)
     alert_level = models.CharField(
@@ -163,47 +329,144 @@ class Monitor(Alarm):
 
     _HEALTHY = 'GREEN'
     _UNHEALTHY = 'RED'
+    _TITLE_FORMAT = ('Health monitor "{name}" has seen no activity '
+                     'for over {downtime}.')
+
+    _now = None
+    _last_doc_cache = None
+    _inactive_cache = None
+    _loaded_values = None
 
     objects = MonitorManager()
 
     def __str__(self):
         return self.name
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Overrides the from_db() method to keep a record of the values
+        loaded from the database, so the Monitor can tell which fields
+        have changed when it is saved.
+        """
+        instance = super(Monitor, cls).from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
     def save(self, *args, **kwargs):
         """
         Overrides the save() method to validate distilleries and update
-        the status of the Monitor.
+        the status of the Monitor. If the Monitor was loaded from the
+        database and is being saved to the same row, only the fields
+        that have changed are saved, along with last_updated.
         """
+        self.interval_seconds = dt.convert_time_to_seconds(self.time_interval,
+                                                           self.time_unit)
         self._update_fields()
+
+        if (self._is_loaded_row() and not args
+                and kwargs.get('update_fields') is None
+                and not kwargs.get('force_insert')):
+            kwargs['update_fields'] = self._get_dirty_fields()
+            kwargs['update_fields'].add('last_updated')
+
         super(Monitor, self).save(*args, **kwargs)
 
-    def _get_interval_in_seconds(self):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None and len(args) > 3:
+            update_fields = args[3]
+        self._refresh_loaded_values(update_fields)
+
+    def _is_loaded_row(self):
         """
-        Returns the number of minutes in the Monitor's time interval.
+        Returns a Boolean indicating whether the Monitor was loaded
+        from the database and still has the primary key it was loaded
+        with. A Monitor whose pk has been changed or cleared (e.g., to
+        save a copy of it) is saved as a whole.
         """
-        return dt.convert_time_to_seconds(self.time_interval, self.time_unit)
+        if self._loaded_values is None or self.pk is None:
+            return False
+        loaded_pk = self._loaded_values.get(self._meta.pk.attname)
+        return self.pk == loaded_pk
 
-    def _get_inactive_seconds(self):
+    def _refresh_loaded_values(self, update_fields=None):
         """
-        Returns the number of seconds since a document was saved to one
-        of the Monitor's distilleries.
+        Takes an optional iterable of the names of the fields that were
+        just saved, and records their current values as the values in
+        the database. If no fields are given, the whole Monitor was
+        saved, so the values of all its loaded fields are recorded.
+        Returns None.
         """
-        if self.last_healthy is not None or self.created_date is not None:
-            if self.last_healthy is not None:
-                time_delta = timezone.now() - self.last_healthy
-            else:
-                time_delta = timezone.now() - self.created_date
-            return time_delta.total_seconds()
-        else:
+        current_values = self._get_current_values()
+        if update_fields is None:
+            self._loaded_values = current_values
+            return
+
+        if self._loaded_values is None:
+            self._loaded_values = {}
+        for name in update_fields:
+            attname = self._meta.get_field(name).attname
+            if attname in current_values:
+                self._loaded_values[attname] = current_values[attname]
+
+    def _get_current_values(self):
+        """
+        Returns a dictionary that maps the attnames of the Monitor's
+        loaded concrete fields to their current values.
+        """
+        return dict(
+            (field.attname, getattr(self, field.attname))
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+        )
+
+    def _get_dirty_fields(self):
+        """
+        Returns a set with the names of the Monitor's concrete fields
+        whose values have changed since the Monitor was loaded from the
+        database. Deferred fields that were never loaded and the
+        primary key are ignored.
+        """
+        loaded_values = self._loaded_values or {}
+        dirty_fields = set()
+        for field in self._meta.concrete_fields:
+            attname = field.attname
+            if field.primary_key:
+                continue
+            if attname in self.__dict__ and (
+                    attname not in loaded_values
+                    or loaded_values[attname] != getattr(self, attname)):
+                dirty_fields.add(field.name)
+        return dirty_fields
+
+    def _get_now(self):
+        """
+        Returns a DateTime representing the time of the Monitor's
+        current status check. If the Monitor hasn't been checked since
+        it was loaded, returns the current time.
+        """
+        if self._now is None:
+            return timezone.now()
+        return self._now
+
+    def _get_inactive_seconds(self, now):
+        """
+        Takes a DateTime representing the current time and returns the
+        number of seconds since a document was saved to one of the
+        Monitor's distilleries.
+        """
+        inactive_since = self.last_healthy or self.created_date
+        if inactive_since is None:
             return 0
+        return (now - inactive_since).total_seconds()
 
-    def _get_last_alert_seconds(self):
+    def _get_last_alert_seconds(self, now):
         """
-        Returns the number of seconds since the Monitor last generated
-        an Alert.
+        Takes a DateTime representing the current time and returns the
+        number of seconds since the Monitor last generated an Alert.
         """
         if self.last_alert_date is not None:
-            time_delta = timezone.now() - self.last_alert_date
+            time_delta = now - self.last_alert_date
             return time_delta.total_seconds()
 
     def _get_inactive_interval(self):
@@ -211,8 +474,13 @@ class Monitor(Alarm):
         Returns a string with the approximate time since a document was
         saved to one of the Monitor's distilleries (e.g., '35 s', '6 m',
         '2 h', '1 d'). The time is rounded down to the nearest integer.
+        Reuses the time calculated by _is_overdue() for the same check.
         """
-        seconds = self._get_inactive_seconds()
+        now = self._get_now()
+        if self._inactive_cache and self._inactive_cache[0] == now:
+            seconds = self._inactive_cache[1]
+        else:
+            seconds = self._get_inactive_seconds(now)
         return dt.convert_seconds(seconds)
 
     def _is_overdue(self):
@@ -221,22 +489,24 @@ class Monitor(Alarm):
         was last saved to one of the Monitor's distilleries exceeds the
         Monitor's interval.
         """
-        return self._get_inactive_seconds() > self._get_interval_in_seconds()
+        now = self._get_now()
+        inactive_seconds = self._get_inactive_seconds(now)
+        self._inactive_cache = (now, inactive_seconds)
+        return inactive_seconds > self.interval_seconds
 
-    def _get_interval_start(self):
+    def _get_interval_start(self, now):
         """
-        Returns a DateTime representing the start of the monitoring
-        interval.
+        Takes a DateTime representing the current time and returns a
+        DateTime representing the start of the monitoring interval.
         """
-        seconds = self._get_interval_in_seconds()
-        return timezone.now() - timedelta(seconds=seconds)
+        return now - timedelta(seconds=self.interval_seconds)
 
     def _get_query_start_time(self):
         """
         Returns either the last_healthy datetime or the start of the
         monitoring interval, whichever is older.
         """
-        interval_start = self._get_interval_start()
+        interval_start = self._get_interval_start(self._get_now())
         if self.last_healthy and self.last_healthy < interval_start:
             return self.last_healthy
         else:
@@ -270,26 +540,55 @@ class Monitor(Alarm):
         )
         return Sorter(sort_list=[sort])
 
-    def _get_most_recent_doc(self, distillery):
-        """
-        Takes a Distillery and the most recent document from the
-        monitoring interval, if one exists. Otherwise, returns None.
-        """
-        date_field = distillery.get_searchable_date_field()
-        if date_field:
-            query = self._get_query(date_field)
-            sorter = self._get_sorter(date_field)
-            results = distillery.find(query, sorter, page=1, page_size=1)
-            if results['results']:
-                return results['results'][0]
+    def _get_searches(self, distilleries):
+        """
+        Takes an OrderedDict that maps Distilleries to their searchable
+        date fields and returns a list of (distillery, query, sorter)
+        tuples for the most recent document in each Distillery.
+        Distilleries that share a date field share the same query and
+        sorter.
+        """
+        searches = []
+        params = {}
+        for distillery, date_field in distilleries.items():
+            if date_field not in params:
+                params[date_field] = (self._get_query(date_field),
+                                      self._get_sorter(date_field))
+            searches.append((distillery, ) + params[date_field])
+        return searches
+
+    def _get_most_recent_docs(self, distilleries):
+        """
+        Takes an OrderedDict that maps Distilleries to their searchable
+        date fields and returns an OrderedDict that maps each Distillery
+        to its most recent document from the monitoring interval, or to
+        None if no such document exists. Raises a RuntimeError if any
+        of the Distilleries can't be searched, so a failed search isn't
+        mistaken for a Distillery with no recent documents.
+        """
+        searches = self._get_searches(distilleries)
+        results = Distillery.objects.find_many(searches, page=1, page_size=1)
+        docs = OrderedDict()
+        for distillery, result in results.items():
+            if result is None:
+                raise RuntimeError('Could not search Distillery "%s"'
+                                   % distillery)
+            if result['results']:
+                docs[distillery] = result['results'][0]
+            else:
+                docs[distillery] = None
+        return docs
 
     def _update_doc_info(self):
         """
         Looks for the most recently saved doc among the Distilleries
         being monitored, and updates the relevant field in the Monitor.
         """
-        for distillery in self.distilleries.all():
-            doc = self._get_most_recent_doc(distillery)
+        distilleries = self.date_capable_distilleries
+        if not distilleries:
+            return
+        docs = self._get_most_recent_docs(distilleries)
+        for distillery, doc in docs.items():
             if doc:
                 date = distillery.get_date(doc)
                 if self.last_healthy is None or date > self.last_healthy:
@@ -312,9 +611,10 @@ class Monitor(Alarm):
         """
         Returns a title for an Alert.
         """
-        downtime = self._get_inactive_interval()
-        return 'Health monitor "%s" has seen no activity for over %s.' \
-               % (self.name, downtime)
+        return self._TITLE_FORMAT.format(
+            name=self.name,
+            downtime=self._get_inactive_interval()
+        )
 
     def _alert_due(self):
         """
@@ -325,56 +625,104 @@ class Monitor(Alarm):
         is used to determine whether enough time has passed to generate
         another Alert.
         """
-        last_alert_time = self._get_last_alert_seconds()
+        last_alert_time = self._get_last_alert_seconds(self._get_now())
         if last_alert_time:
-            return last_alert_time > self._get_interval_in_seconds()
+            return last_alert_time > self.interval_seconds
         else:
             return True
 
     def _create_alert(self):
         """
-        Generates an Alert based on the Monitor's alert_level. Returns
-        the saved Alert.
+        Generates an Alert based on the Monitor's alert_level. The
+        Alert's created_date is the time of the Monitor's status check.
+        Returns the unsaved Alert.
         """
         title = self._get_title()
-        alert = Alert(
+        return Alert(
             title=title,
             level=self.alert_level,
             alarm=self,
             distillery=self.last_active_distillery,
-            doc_id=self.last_saved_doc
+            doc_id=self.last_saved_doc,
+            created_date=self._get_now()
         )
-        alert.save()
-        return alert
 
     def _alert(self, old_status):
         """
         Takes a string representing the Monitor's status prior to its
         last update. Determines whether an Alert should be generated,
-        and, if so, creates the Alert and saves the Alert's created_date
-        to the Monitor's last_alert_date field and the Alert's id to the
-        last_alert_id field. Returns None.
+        and, if so, returns the unsaved Alert. Otherwise, returns None.
         """
         repeat_alert = self.repeating_alerts and self._alert_due()
         status_changed = old_status != self._UNHEALTHY
         if self.alerts_enabled and (repeat_alert or status_changed):
-            alert = self._create_alert()
-            self.last_alert_date = alert.created_date
-            self.last_alert_id = alert.pk
-            self.save()
+            return self._create_alert()
+
+    def _set_alert_info(self, alert):
+        """
+        Takes a saved Alert generated by the Monitor and copies its
+        created_date and id to the Monitor's last_alert_date and
+        last_alert_id fields, without saving the Monitor. Returns None.
+        """
+        self.last_alert_date = alert.created_date
+        self.last_alert_id = alert.pk
+
+    def _save_alert_info(self, alert):
+        """
+        Takes a saved Alert generated by the Monitor and saves its
+        created_date and id to the Monitor's last_alert_date and
+        last_alert_id fields. Only those fields are updated, so the
+        Monitor's status is not recalculated. Returns None.
+
+        The database row is only updated if the Alert is newer than the
+        Monitor's last recorded Alert, so if health checks running at
+        the same time both create Alerts for the Monitor, the later
+        Alert is kept. The Monitor instance is only updated if its
+        database row was.
+        """
+        no_alert = models.Q(last_alert_id__isnull=True)
+        older_alert = models.Q(last_alert_id__lt=alert.pk)
+        queryset = type(self).objects.filter(no_alert | older_alert,
+                                             pk=self.pk)
+        updated = queryset.update(
+            last_alert_date=alert.created_date,
+            last_alert_id=alert.pk
+        )
+
+        if updated != 1:
+            return
+
+        self._set_alert_info(alert)
+
+        # the fields were saved, so they shouldn't be saved again with
+        # the Monitor's other changes
+        if self._loaded_values is not None:
+            self._loaded_values.update(
+                last_alert_date=self.last_alert_date,
+                last_alert_id=self.last_alert_id
+            )
 
     def _find_last_doc(self):
         """
         Returns the last document saved in the last active Distillery,
-        if one exists. Otherwise, returns None.
+        if one exists. Otherwise, returns None. The document is cached
+        on the Monitor until the last saved document changes.
         """
-        return self.last_active_distillery.find_by_id(self.last_saved_doc)
+        doc_key = (self.last_active_distillery_id, self.last_saved_doc)
+        if self._last_doc_cache is None or self._last_doc_cache[0] != doc_key:
+            doc = self.last_active_distillery.find_by_id(self.last_saved_doc)
+            self._last_doc_cache = (doc_key, doc)
+        return self._last_doc_cache[1]
 
-    def _update_fields(self):
+    def _update_fields(self, now=None):
         """
-        Updates the Monitor's fields relating to its status, and last
-        saved document.
+        Takes an optional DateTime representing the time of the status
+        check, and updates the Monitor's fields relating to its status,
+        and last saved document. If no time is given, the current time
+        is used.
         """
+        # use the same time for every check in the update
+        self._now = now or timezone.now()
         if self.id:
             self._update_doc_info()
         self._set_current_status()
@@ -386,18 +734,64 @@ class Monitor(Alarm):
         """
         return str(self.time_interval) + self.time_unit
 
+    def _get_distilleries(self):
+        """
+        Returns a list of the Monitor's Distilleries. If they weren't
+        prefetched when the Monitor was loaded, prefetches them now,
+        along with the related objects used to search them.
+        """
+        prefetched = getattr(self, '_prefetched_objects_cache', {})
+        if 'distilleries' not in prefetched:
+            prefetch = MonitorManager._get_distilleries_prefetch()
+            models.prefetch_related_objects([self], prefetch)
+
+        # only all() uses the prefetched Distilleries; filtering the
+        # related manager would query the database again
+        return list(self.distilleries.all())
+
+    @cached_property
+    def date_capable_distilleries(self):
+        """
+        Returns an OrderedDict that maps each of the Monitor's
+        Distilleries that has a searchable date field to the name of
+        that field. Distilleries without one can't be checked for
+        recent activity, so they are left out.
+
+        The result is cached on the Monitor, and is cleared by the
+        monitors.signals.clear_distillery_cache receiver whenever the
+        Monitor's distilleries change.
+        """
+        distilleries = OrderedDict()
+        for distillery in self._get_distilleries():
+            date_field = distillery.get_searchable_date_field()
+            if date_field:
+                distilleries[distillery] = date_field
+        return distilleries
+
     def last_doc(self):
         """
         Returns a string of the content for the last document saved to
         one of the Monitor's distilleries. If the Monitor has no record
         of a last saved document, returns None.
         """
-        if self.last_active_distillery:
+        if self.last_active_distillery_id:
             doc = self._find_last_doc()
             return json.dumps(doc, indent=4)
 
     last_doc.short_description = _('Last saved document')
 
+    def refresh_status(self, now=None):
+        """
+        Takes an optional DateTime representing the time of the status
+        check, and updates the Monitor's status fields without saving
+        the Monitor. If an Alert should be generated, returns the
+        unsaved Alert. Otherwise, returns None.
+        """
+        old_status = self.status
+        self._update_fields(now)
+        if self.status == self._UNHEALTHY:
+            return self._alert(old_status)
+
     def update_status(self):
         """
         Updates the Monitor's status and creates an Alert if
@@ -406,5 +800,8 @@ class Monitor(Alarm):
         old_status = self.status
         self.save()  # update monitor
         if self.status == self._UNHEALTHY:
-            self._alert(old_status)
+            alert = self._alert(old_status)
+            if alert:
+                alert.save()
+                self._save_alert_info(alert)
         return self.status
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2019 ControlScan, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Defines a receiver for changes to the Distilleries of a Monitor.
+"""
+
+# third party
+from django.db.models.signals import m2m_changed
+from django.dispatch import receiver
+
+# local
+from monitors.models import Monitor
+
+
+@receiver(m2m_changed, sender=Monitor.distilleries.through)
+def clear_distillery_cache(sender, instance, action, **kwargs):
+    """
+    Receiver for the m2m_changed signal of a Monitor's distilleries.
+    Clears the Monitor's cached date_capable_distilleries so they will
+    be recalculated the next time they're needed.
+    """
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        instance.__dict__.pop('date_capable_distilleries', None)
@@ -21,13 +21,14 @@ Tests the Monitor class.
 # standard library
 from datetime import datetime
 try:
-    from unittest.mock import Mock, patch
+    from unittest.mock import Mock, PropertyMock, patch
 except ImportError:
-    from mock import Mock, patch
+    from mock import Mock, PropertyMock, patch
 import logging
 
 # third party
 from django.test import TestCase
+from testfixtures import LogCapture
 
 # local
 from alerts.models import Alert
@@ -41,6 +42,24 @@ ON_TIME = datetime.strptime('2016-01-01 09:05:00 +0000', '%Y-%m-%d %H:%M:%S %z')
 LATE = datetime.strptime('2016-01-01 09:06:00 +0000', '%Y-%m-%d %H:%M:%S %z')
 VERY_LATE = datetime.strptime('2016-01-02 09:05:00 +0000', '%Y-%m-%d %H:%M:%S %z')
 
+NO_DOCS = {'count': 0, 'results': []}
+
+
+def patch_engine(results=None):
+    """
+    Returns a patch for the Engine of every Distillery. The Engine's
+    find_many method returns the given list of results, or no documents
+    for each search if no results are given.
+    """
+    engine = Mock()
+    if results is None:
+        engine.find_many.side_effect = \
+            lambda searches, **kwargs: [NO_DOCS for _ in searches]
+    else:
+        engine.find_many.return_value = results
+    return patch('distilleries.models.Distillery.engine',
+                 new_callable=PropertyMock, return_value=engine)
+
 
 class MonitorManagerTestCase(TestCase):
     """
@@ -71,6 +90,225 @@ class MonitorManagerTestCase(TestCase):
         relevant_monitors = Monitor.objects.find_relevant(distillery)
         self.assertEqual(relevant_monitors.count(), 3)
 
+    def test_find_shard(self):
+        """
+        Tests the find_shard method of the MonitorManager class.
+        """
+        shards = [Monitor.objects.find_shard(index, 2) for index in range(2)]
+        shard_ids = [set(shard.values_list('id', flat=True))
+                     for shard in shards]
+        self.assertEqual(shard_ids[0], set([2]))
+        self.assertEqual(shard_ids[1], set([1, 3, 5]))
+
+    def test_find_relevant_prefetch(self):
+        """
+        Tests that the find_relevant method of the MonitorManager class
+        prefetches the Monitors' Distilleries.
+        """
+        distillery = Distillery.objects.get(pk=1)
+
+        # one query each for the Monitors, their Distilleries, and the
+        # fields of the Distilleries' Bottles and Labels
+        with self.assertNumQueries(4):
+            relevant_monitors = Monitor.objects.find_relevant(distillery)
+            for monitor in relevant_monitors:
+                for monitor_distillery in monitor.distilleries.all():
+                    monitor_distillery.collection.warehouse
+                    monitor_distillery.container.bottle
+                    monitor_distillery.container.label
+                    monitor_distillery.taste
+
+    def test_get_distilleries_prefetch_schema(self):
+        """
+        Tests that the Prefetch returned by the _get_distilleries_prefetch
+        method of the MonitorManager class includes the objects used to
+        build a Distillery's schema.
+        """
+        prefetch = Monitor.objects._get_distilleries_prefetch()
+
+        # the mail Distillery's Bottle has no embedded Bottles, which
+        # are looked up separately by Bottle.get_fields()
+        distillery = prefetch.queryset.get(pk=6)
+        with self.assertNumQueries(0):
+            schema = distillery.schema
+        self.assertEqual(len(schema), 5)
+
+    def test_get_queryset(self):
+        """
+        Tests that the get_queryset method of the MonitorManager class
+        selects the last active Distillery.
+        """
+        with self.assertNumQueries(1):
+            monitor = Monitor.objects.get(pk=1)
+            self.assertEqual(monitor.last_active_distillery.pk, 1)
+
+    @patch_find_by_id()
+    @patch('alerts.models.Alert.teaser')
+    @patch('monitors.models.timezone.now', return_value=VERY_LATE)
+    def test_update_all_statuses(self, mock_now, mock_teaser):
+        """
+        Tests the update_all_statuses method of the MonitorManager class.
+        """
+        assert Alert.objects.count() == 0
+
+        mock_teaser.get = Mock(return_value=None)
+        with patch_engine():
+            Monitor.objects.update_all_statuses()
+
+        for monitor in Monitor.objects.find_enabled():
+            self.assertEqual(monitor.status, 'RED')
+            self.assertEqual(monitor.last_updated, VERY_LATE)
+
+        # disabled Monitors are not updated
+        disabled_monitor = Monitor.objects.get(pk=4)
+        self.assertNotEqual(disabled_monitor.last_updated, VERY_LATE)
+
+        # the green Monitor and the repeating Monitor generate Alerts
+        self.assertEqual(Alert.objects.count(), 2)
+        for monitor in Monitor.objects.filter(pk__in=[1, 5]):
+            alert = Alert.objects.get(alarm_id=monitor.pk)
+            self.assertEqual(alert.created_date, VERY_LATE)
+            self.assertEqual(alert.created_date, monitor.last_alert_date)
+            self.assertEqual(alert.pk, monitor.last_alert_id)
+
+    @patch_find_by_id()
+    @patch('alerts.models.Alert.teaser')
+    @patch('monitors.models.timezone.now', return_value=VERY_LATE)
+    def test_update_all_statuses_failed_search(self, mock_now, mock_teaser):
+        """
+        Tests that the update_all_statuses method of the MonitorManager
+        class skips the Monitors whose Distilleries can't be searched.
+        """
+        def find_many(searches, **kwargs):
+            # only the Monitor with pk=5 watches a single Distillery, so
+            # the searches for the other Monitors fail
+            if len(searches) > 1:
+                return None
+            return [NO_DOCS for _ in searches]
+
+        mock_teaser.get = Mock(return_value=None)
+        with patch_engine() as mock_engine:
+            mock_engine.return_value.find_many.side_effect = find_many
+            with LogCapture('monitors.models') as log_capture:
+                Monitor.objects.update_all_statuses()
+                messages = [record.getMessage()
+                            for record in log_capture.records]
+
+        self.assertEqual(len(messages), 3)
+        for monitor in Monitor.objects.filter(pk__in=[1, 2, 3]):
+            self.assertTrue(any('"%s"' % monitor.name in message
+                                for message in messages))
+            self.assertNotEqual(monitor.last_updated, VERY_LATE)
+        self.assertFalse(Alert.objects.filter(alarm_id=1).exists())
+
+        # the Monitor whose search succeeded is updated
+        monitor = Monitor.objects.get(pk=5)
+        self.assertEqual(monitor.last_updated, VERY_LATE)
+        self.assertTrue(Alert.objects.filter(alarm_id=5).exists())
+
+    @patch_find_by_id()
+    @patch('alerts.models.Alert.teaser')
+    @patch('monitors.models.timezone.now', return_value=VERY_LATE)
+    def test_update_all_statuses_error(self, mock_now, mock_teaser):
+        """
+        Tests that the update_all_statuses method of the MonitorManager
+        class still updates the other Monitors when one Monitor's search
+        raises an error.
+        """
+        get_most_recent_docs = Monitor._get_most_recent_docs
+
+        def search(monitor, distilleries):
+            if monitor.pk == 1:
+                raise RuntimeError('search failed')
+            return get_most_recent_docs(monitor, distilleries)
+
+        mock_teaser.get = Mock(return_value=None)
+        with patch_engine():
+            with patch.object(Monitor, '_get_most_recent_docs',
+                              autospec=True, side_effect=search):
+                with LogCapture('monitors.models') as log_capture:
+                    Monitor.objects.update_all_statuses()
+                    log_capture.check(
+                        ('monitors.models',
+                         'ERROR',
+                         'Error checking the status of Monitor '
+                         '"health_alerts": search failed'),
+                    )
+
+        # the Monitor that raised the error is left as it was
+        failed_monitor = Monitor.objects.get(pk=1)
+        self.assertEqual(failed_monitor.status, 'GREEN')
+        self.assertNotEqual(failed_monitor.last_updated, VERY_LATE)
+        self.assertFalse(Alert.objects.filter(alarm_id=1).exists())
+
+        for monitor in Monitor.objects.filter(pk__in=[2, 3, 5]):
+            self.assertEqual(monitor.status, 'RED')
+            self.assertEqual(monitor.last_updated, VERY_LATE)
+
+        # the repeating Monitor still generates an Alert
+        self.assertEqual(Alert.objects.count(), 1)
+        self.assertEqual(Alert.objects.get().alarm_id, 5)
+
+    @patch_find_by_id()
+    @patch('alerts.models.Alert.teaser')
+    @patch('monitors.models.timezone.now', return_value=VERY_LATE)
+    def test_update_all_statuses_alert_error(self, mock_now, mock_teaser):
+        """
+        Tests that the update_all_statuses method of the MonitorManager
+        class still saves the Monitors' statuses and the other Alerts
+        when one Alert can't be saved.
+        """
+        save_alert = Alert.save
+
+        def save(alert, *args, **kwargs):
+            if alert.alarm_id == 1:
+                raise RuntimeError('save failed')
+            return save_alert(alert, *args, **kwargs)
+
+        mock_teaser.get = Mock(return_value=None)
+        with patch_engine():
+            with patch.object(Alert, 'save', autospec=True, side_effect=save):
+                with LogCapture('monitors.models') as log_capture:
+                    Monitor.objects.update_all_statuses()
+                    log_capture.check(
+                        ('monitors.models',
+                         'ERROR',
+                         'Error saving an Alert for Monitor '
+                         '"health_alerts": save failed'),
+                    )
+
+        for monitor in Monitor.objects.find_enabled():
+            self.assertEqual(monitor.status, 'RED')
+            self.assertEqual(monitor.last_updated, VERY_LATE)
+
+        self.assertEqual(Monitor.objects.get(pk=1).last_alert_id, None)
+        self.assertEqual(Alert.objects.count(), 1)
+        alert = Alert.objects.get()
+        self.assertEqual(alert.alarm_id, 5)
+        self.assertEqual(Monitor.objects.get(pk=5).last_alert_id, alert.pk)
+
+    def test_bulk_update(self):
+        """
+        Tests the _bulk_update method of the MonitorManager class.
+        """
+        monitors = list(Monitor.objects.filter(pk__in=[1, 3]))
+        monitors[0].status = 'RED'
+        monitors[0].last_saved_doc = None
+        monitors[1].last_active_distillery_id = 1
+        monitors[1].last_healthy = VERY_LATE
+        fields = ['status', 'last_saved_doc', 'last_active_distillery',
+                  'last_healthy']
+        with self.assertNumQueries(1):
+            Monitor.objects._bulk_update(monitors, fields)
+
+        monitor_1 = Monitor.objects.get(pk=1)
+        self.assertEqual(monitor_1.status, 'RED')
+        self.assertEqual(monitor_1.last_saved_doc, None)
+        monitor_3 = Monitor.objects.get(pk=3)
+        self.assertEqual(monitor_3.status, 'RED')
+        self.assertEqual(monitor_3.last_active_distillery_id, 1)
+        self.assertEqual(monitor_3.last_healthy, VERY_LATE)
+
 
 class MonitorTestCase(TestCase):
     """
@@ -131,63 +369,214 @@ class MonitorTestCase(TestCase):
         monitor_red = Monitor.objects.get(pk=3)
         self.assertEqual(monitor_red.status, 'GREEN')
 
-    def test_get_interval_in_seconds(self):
+    def test_interval_seconds(self):
+        """
+        Tests that the interval_seconds field of the Monitor class is
+        saved to the database.
+        """
+        monitor = Monitor.objects.get(pk=1)
+        monitor.time_interval = 2
+        with patch_engine():
+            monitor.save()
+        saved = Monitor.objects.filter(pk=1).values_list('interval_seconds',
+                                                          flat=True)
+        self.assertEqual(saved.get(), 120)
+
+    def test_interval_seconds_after_save(self):
         """
-        Tests the _get_interval_in_seconds method of the Monitor class
-        when there is a last_healthy value.
+        Tests that the interval_seconds field of the Monitor class is
+        recalculated when the Monitor is saved.
         """
-        self.assertEqual(self.monitor_grn._get_interval_in_seconds(), 300)
+        monitor = self.monitor_grn
+        assert monitor.interval_seconds == 300
+        monitor.time_unit = 'h'
+        with patch_engine():
+            monitor.save()
+        self.assertEqual(monitor.interval_seconds, 18000)
+
+    def test_get_dirty_fields(self):
+        """
+        Tests the _get_dirty_fields method of the Monitor class.
+        """
+        monitor = self.monitor_grn
+        self.assertEqual(monitor._get_dirty_fields(), set())
+        monitor.status = 'RED'
+        monitor.last_active_distillery_id = 2
+        self.assertEqual(monitor._get_dirty_fields(),
+                         set(['status', 'last_active_distillery']))
+
+    def test_save_dirty_fields(self):
+        """
+        Tests that the save method of the Monitor class only saves the
+        fields that have changed since the Monitor was loaded.
+        """
+        monitor = self.monitor_grn
+        Monitor.objects.filter(pk=1).update(alert_level='LOW')
+        monitor.name = 'renamed'
+        with patch_engine():
+            monitor.save()
+        saved = Monitor.objects.get(pk=1)
+        self.assertEqual(saved.name, 'renamed')
+        self.assertEqual(saved.alert_level, 'LOW')
+        self.assertEqual(monitor._get_dirty_fields(), set())
+
+    def test_save_copy(self):
+        """
+        Tests that the save method of the Monitor class saves a copy of
+        a loaded Monitor as a new Monitor when its pk is cleared.
+        """
+        monitor_count = Monitor.objects.count()
+        monitor = self.monitor_grn
+        monitor.pk = None
+        monitor.name = 'copied monitor'
+        with patch_engine():
+            monitor.save()
+        self.assertEqual(Monitor.objects.count(), monitor_count + 1)
+        self.assertNotEqual(monitor.pk, 1)
+        self.assertEqual(Monitor.objects.get(pk=1).name, 'health_alerts')
+        self.assertEqual(Monitor.objects.get(pk=monitor.pk).name,
+                         'copied monitor')
 
     @patch('monitors.models.timezone.now', return_value=VERY_LATE)
-    def test_get_inactive_no_lasthealth(self, mock_now):
+    def test_save_update_fields(self, mock_now):
+        """
+        Tests that changes to fields not named in update_fields can
+        still be saved after the save method of the Monitor class is
+        called with update_fields.
+        """
+        monitor = self.monitor_grn
+        monitor.name = 'renamed'
+        with patch_engine():
+            monitor.save(update_fields=['name'])
+        self.assertEqual(monitor.status, 'RED')
+        self.assertEqual(Monitor.objects.get(pk=1).status, 'GREEN')
+        self.assertEqual(monitor._get_dirty_fields(), set(['status']))
+
+        with patch_engine():
+            monitor.save()
+        saved = Monitor.objects.get(pk=1)
+        self.assertEqual(saved.name, 'renamed')
+        self.assertEqual(saved.status, 'RED')
+
+    def test_get_inactive_no_lasthealth(self):
         """
         Tests the _get_inactive_seconds method of the Monitor class when
         there is no last_healthy value.
         """
         monitor = self.monitor_red_repeating
         assert monitor.last_healthy == None
-        self.assertEqual(monitor._get_inactive_seconds(), 86700)
+        self.assertEqual(monitor._get_inactive_seconds(VERY_LATE), 86700)
 
-    @patch('monitors.models.timezone.now', return_value=VERY_LATE)
-    def test_get_inactive_seconds(self, mock_now):
+    def test_get_inactive_seconds(self):
         """
         Tests the _get_inactive_seconds method of the Monitor class.
         """
-        self.assertEqual(self.monitor_grn._get_inactive_seconds(), 86700)
+        self.assertEqual(self.monitor_grn._get_inactive_seconds(VERY_LATE),
+                         86700)
 
-    @patch('monitors.models.timezone.now', return_value=EARLY)
-    def test_is_overdue_for_not_late(self, mock_now):
+    def test_get_inactive_new_monitor(self):
+        """
+        Tests the _get_inactive_seconds method of the Monitor class for
+        a Monitor that hasn't been saved.
+        """
+        monitor = Monitor(name='new monitor', time_interval=1, time_unit='d')
+        self.assertEqual(monitor._get_inactive_seconds(VERY_LATE), 0)
+
+    def test_get_last_alert_seconds(self):
+        """
+        Tests the _get_last_alert_seconds method of the Monitor class.
+        """
+        monitor = self.monitor_red_repeating
+        self.assertEqual(monitor._get_last_alert_seconds(LATE), 360)
+
+    def test_is_overdue_for_not_late(self):
         """
         Tests the _is_overdue method of the Monitor class when the
         difference between the last_healthy time and the current time
         is less than the monitoring interval.
         """
+        self.monitor_grn._now = EARLY
         self.assertEqual(self.monitor_grn._is_overdue(), False)
 
-    @patch('monitors.models.timezone.now', return_value=ON_TIME)
-    def test_is_overdue_for_on_time(self, mock_now):
+    def test_is_overdue_for_on_time(self):
         """
         Tests the _is_overdue method of the Monitor class when the
         difference between the last_healthy time and the current time
         is equal to the monitoring interval.
         """
+        self.monitor_grn._now = ON_TIME
         self.assertEqual(self.monitor_grn._is_overdue(), False)
 
-    @patch('monitors.models.timezone.now', return_value=LATE)
-    def test_is_overdue_for_late(self, mock_now):
+    def test_is_overdue_for_late(self):
         """
         Tests the _is_overdue method of the Monitor class when the
         difference between the last_healthy time and the current time
         is greater than the monitoring interval.
         """
+        self.monitor_grn._now = LATE
         self.assertEqual(self.monitor_grn._is_overdue(), True)
 
     @patch_find_by_id()
     @patch('monitors.models.timezone.now', return_value=LATE)
-    def test_create_alert(self, mock_now):
+    def test_unchecked_monitor(self, mock_now):
+        """
+        Tests that the status helpers of the Monitor class use the
+        current time for a Monitor that hasn't been checked since it
+        was loaded.
+        """
+        monitor = self.monitor_grn
+        assert monitor._now is None
+        self.assertEqual(monitor._is_overdue(), True)
+        self.assertEqual(monitor._alert_due(), True)
+        self.assertEqual(monitor._get_query_start_time(),
+                         monitor.last_healthy)
+        self.assertEqual(monitor._get_inactive_interval(), '6 m')
+        self.assertEqual(monitor._create_alert().created_date, LATE)
+
+    def test_get_inactive_interval_cached(self):
+        """
+        Tests that the _get_inactive_interval method of the Monitor class
+        reuses the inactive time calculated by the _is_overdue method.
+        """
+        monitor = self.monitor_grn
+        monitor._now = LATE
+        monitor._is_overdue()
+        with patch.object(monitor, '_get_inactive_seconds') as mock_seconds:
+            self.assertEqual(monitor._get_inactive_interval(), '6 m')
+            mock_seconds.assert_not_called()
+
+        # a check at a different time recalculates the inactive time
+        monitor._now = VERY_LATE
+        self.assertNotEqual(monitor._get_inactive_interval(), '6 m')
+
+    @patch('monitors.models.timezone.now', return_value=LATE)
+    def test_update_fields_now(self, mock_now):
+        """
+        Tests that the _update_fields method of the Monitor class only
+        gets the current time once.
+        """
+        with patch_engine():
+            self.monitor_grn._update_fields()
+        self.assertEqual(mock_now.call_count, 1)
+        self.assertEqual(self.monitor_grn._now, LATE)
+
+    @patch('monitors.models.timezone.now', return_value=LATE)
+    def test_update_fields_given_now(self, mock_now):
+        """
+        Tests that the _update_fields method of the Monitor class uses
+        the time it is given instead of the current time.
+        """
+        with patch_engine():
+            self.monitor_grn._update_fields(VERY_LATE)
+        mock_now.assert_not_called()
+        self.assertEqual(self.monitor_grn._now, VERY_LATE)
+
+    @patch_find_by_id()
+    def test_create_alert(self):
         """
         Tests the _create_alert method of the Monitor class.
         """
+        self.monitor_red._now = LATE
         alert = self.monitor_red._create_alert()
         title = 'Health monitor "unhealthy_alerts" has seen no activity for over 6 m.'
         self.assertEqual(alert.title, title)
@@ -195,6 +584,115 @@ class MonitorTestCase(TestCase):
         self.assertEqual(alert.level, self.monitor_red.alert_level)
         self.assertEqual(alert.distillery, self.monitor_red.last_active_distillery)
         self.assertEqual(alert.doc_id, self.monitor_red.last_saved_doc)
+        self.assertEqual(alert.created_date, LATE)
+        self.assertEqual(alert.pk, None)
+
+    def test_get_most_recent_docs(self):
+        """
+        Tests the _get_most_recent_docs method of the Monitor class.
+        """
+        self.monitor_grn._now = LATE
+        distilleries = self.monitor_grn.date_capable_distilleries
+        results = [{'count': 1, 'results': [{'_id': 1}]}, NO_DOCS]
+        with patch_engine(results) as mock_engine:
+            actual = self.monitor_grn._get_most_recent_docs(distilleries)
+            self.assertEqual(list(actual.keys()), list(distilleries))
+            self.assertEqual(list(actual.values()), [{'_id': 1}, None])
+
+            # the Distilleries share an Engine class, date field, and
+            # query, so they are searched together
+            mock_find_many = mock_engine.return_value.find_many
+            self.assertEqual(mock_find_many.call_count, 1)
+            searches = mock_find_many.call_args[0][0]
+            self.assertEqual(len(searches), 2)
+            self.assertIs(searches[0][1], searches[1][1])
+            self.assertEqual(mock_find_many.call_args[1],
+                             {'page': 1, 'page_size': 1})
+
+    def test_get_most_recent_docs_failed(self):
+        """
+        Tests that the _get_most_recent_docs method of the Monitor class
+        raises an error when a Distillery can't be searched.
+        """
+        self.monitor_grn._now = LATE
+        distilleries = self.monitor_grn.date_capable_distilleries
+        with patch_engine() as mock_engine:
+            mock_engine.return_value.find_many.side_effect = None
+            mock_engine.return_value.find_many.return_value = None
+            with self.assertRaises(RuntimeError):
+                self.monitor_grn._get_most_recent_docs(distilleries)
+
+    def test_date_capable_distilleries(self):
+        """
+        Tests the date_capable_distilleries property of the Monitor class.
+        """
+        distilleries = list(self.monitor_grn.distilleries.all())
+        actual = self.monitor_grn.date_capable_distilleries
+        self.assertEqual(list(actual.keys()), distilleries)
+        self.assertEqual(
+            list(actual.values()),
+            [distillery.get_searchable_date_field()
+             for distillery in distilleries]
+        )
+
+    def test_get_distilleries_prefetched(self):
+        """
+        Tests that the _get_distilleries method of the Monitor class
+        uses Distilleries that have already been prefetched.
+        """
+        distillery = Distillery.objects.get(pk=1)
+        monitor = Monitor.objects.find_relevant(distillery).get(pk=1)
+        with self.assertNumQueries(0):
+            distilleries = monitor._get_distilleries()
+            for distillery in distilleries:
+                distillery.get_searchable_date_field()
+                container = distillery.container
+                list(container.bottle.fields.all())
+                list(container.label.fields.all())
+        self.assertEqual(len(distilleries), 2)
+
+    def test_get_distilleries_not_prefetched(self):
+        """
+        Tests that the _get_distilleries method of the Monitor class
+        prefetches the Monitor's Distilleries if they haven't already
+        been prefetched.
+        """
+        monitor = self.monitor_grn
+
+        # one query for the Distilleries, and one each for the fields of
+        # their Bottles and Labels
+        with self.assertNumQueries(3):
+            monitor._get_distilleries()
+        with self.assertNumQueries(0):
+            for distillery in monitor._get_distilleries():
+                distillery.collection.warehouse
+                distillery.container.bottle
+                distillery.container.label
+                distillery.taste
+
+    def test_date_capable_distilleries_no_date(self):
+        """
+        Tests the date_capable_distilleries property of the Monitor class
+        for Distilleries without a searchable date field.
+        """
+        with patch('monitors.models.Distillery.get_searchable_date_field',
+                   return_value=None):
+            actual = self.monitor_grn.date_capable_distilleries
+        self.assertEqual(len(actual), 0)
+
+    def test_update_doc_info_no_date(self):
+        """
+        Tests the _update_doc_info method of the Monitor class when
+        none of its Distilleries have a searchable date field.
+        """
+        self.monitor_grn._now = LATE
+        last_healthy = self.monitor_grn.last_healthy
+        with patch_engine() as mock_engine:
+            with patch('monitors.models.Distillery.get_searchable_date_field',
+                       return_value=None):
+                self.monitor_grn._update_doc_info()
+            mock_engine.return_value.find_many.assert_not_called()
+        self.assertEqual(self.monitor_grn.last_healthy, last_healthy)
 
     @patch('monitors.models.timezone.now', return_value=ON_TIME)
     def test_update_status(self, mock_now):
@@ -211,10 +709,10 @@ class MonitorTestCase(TestCase):
             {'count': 1, 'results': [{'_id': 1, 'created_date': LATE}]},
             {'count': 1, 'results': [{'_id': 2, 'created_date': VERY_LATE}]},
         ]
-        with patch('monitors.models.Distillery.find', side_effect=docs) \
-                as mock_find:
+        with patch_engine(docs) as mock_engine:
             monitor.update_status()
-            mock_find.call_count = 2
+            mock_find_many = mock_engine.return_value.find_many
+            self.assertEqual(mock_find_many.call_count, 1)
 
             # get a fresh instance from the database
             updated_monitor = Monitor.objects.get(pk=monitor.pk)
@@ -370,6 +868,67 @@ class MonitorTestCase(TestCase):
         self.assertEqual(alert.pk, monitor.last_alert_id)
         self.assertEqual(result, 'RED')
 
+    @patch('monitors.models.timezone.now', return_value=VERY_LATE)
+    def test_refresh_status(self, mock_now):
+        """
+        Tests that the refresh_status method of the Monitor class
+        returns an unsaved Alert and doesn't save the Monitor.
+        """
+        monitor = self.monitor_grn
+        with patch_engine():
+            alert = monitor.refresh_status()
+
+        self.assertEqual(monitor.status, 'RED')
+        self.assertEqual(alert.pk, None)
+        self.assertEqual(alert.alarm, monitor)
+        self.assertEqual(Alert.objects.count(), 0)
+        self.assertEqual(Monitor.objects.get(pk=monitor.pk).status, 'GREEN')
+
+    @patch_find_by_id()
+    @patch('alerts.models.Alert.teaser')
+    @patch('monitors.models.timezone.now', return_value=VERY_LATE)
+    def test_alert_saves_once(self, mock_now, mock_teaser):
+        """
+        Tests that the update_status method of the Monitor class only
+        checks the Monitor's Distilleries once when it creates an Alert.
+        """
+        monitor = self.monitor_grn
+        mock_teaser.get = Mock(return_value=None)
+        with patch_engine() as mock_engine:
+            monitor.update_status()
+            mock_find_many = mock_engine.return_value.find_many
+            self.assertEqual(mock_find_many.call_count, 1)
+
+        updated_monitor = Monitor.objects.get(pk=monitor.pk)
+        self.assertEqual(Alert.objects.count(), 1)
+        self.assertEqual(updated_monitor.last_alert_id,
+                         Alert.objects.get().pk)
+
+    @patch_find_by_id()
+    @patch('alerts.models.Alert.teaser')
+    def test_save_alert_info_older_alert(self, mock_teaser):
+        """
+        Tests that the _save_alert_info method of the Monitor class
+        doesn't replace the Monitor's last Alert with an older one.
+        """
+        mock_teaser.get = Mock(return_value=None)
+        monitor = self.monitor_red
+        monitor._now = LATE
+        older_alert = monitor._create_alert()
+        older_alert.save()
+        newer_alert = monitor._create_alert()
+        newer_alert.save()
+
+        monitor._save_alert_info(newer_alert)
+        monitor._save_alert_info(older_alert)
+
+        updated_monitor = Monitor.objects.get(pk=monitor.pk)
+        self.assertEqual(updated_monitor.last_alert_id, newer_alert.pk)
+
+        # the instance keeps the Alert that was saved to the database
+        self.assertEqual(monitor.last_alert_id, newer_alert.pk)
+        self.assertEqual(monitor.last_alert_date, newer_alert.created_date)
+
     @patch_find_by_id()
     @patch('alerts.models.Alert.teaser')
     @patch('monitors.models.timezone.now', return_value=LATE)
@@ -403,6 +962,23 @@ class MonitorTestCase(TestCase):
         expected = '{\n    "title": "foo"\n}'
         self.assertEqual(actual, expected)
 
+    def test_last_doc_cached(self):
+        """
+        Tests that the last_doc method of the Monitor class only fetches
+        the last saved document again when it changes.
+        """
+        monitor = self.monitor_grn
+        with patch('distilleries.models.Distillery.find_by_id',
+                   return_value={'title': 'foo'}) as mock_find:
+            monitor.last_doc()
+            monitor.last_doc()
+            self.assertEqual(mock_find.call_count, 1)
+
+            monitor.last_saved_doc = '11'
+            monitor.last_doc()
+            self.assertEqual(mock_find.call_count, 2)
+            mock_find.assert_called_with('11')
+
     def test_last_doc_no_distillery(self):
         """
         Tests the last_doc method of the Monitor class when the Monitor
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Copyright 2017-2019 ControlScan, Inc.
+#
+# This file is part of Cyphon Engine.
+#
+# Cyphon Engine is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+#
+# Cyphon Engine is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cyphon Engine. If not, see <http://www.gnu.org/licenses/>.
+"""
+Tests signals in the Monitors app.
+"""
+
+# third party
+from django.test import TestCase
+
+# local
+from distilleries.models import Distillery
+from monitors.models import Monitor
+from tests.fixture_manager import get_fixtures
+
+
+class ClearDistilleryCacheTestCase(TestCase):
+    """
+    Tests the clear_distillery_cache receiver.
+    """
+    fixtures = get_fixtures(['monitors'])
+
+    def setUp(self):
+        self.monitor = Monitor.objects.get(pk=1)
+        self.distillery = Distillery.objects.get(pk=1)
+        assert self.distillery in self.monitor.date_capable_distilleries
+
+    def test_remove_distillery(self):
+        """
+        Tests that a Monitor's date_capable_distilleries are recalculated
+        after a Distillery is removed from it.
+        """
+        self.monitor.distilleries.remove(self.distillery)
+        self.assertNotIn(self.distillery,
+                         self.monitor.date_capable_distilleries)
+
+    def test_add_distillery(self):
+        """
+        Tests that a Monitor's date_capable_distilleries are recalculated
+        after a Distillery is added to it.
+        """
+        self.monitor.distilleries.clear()
+        self.assertEqual(len(self.monitor.date_capable_distilleries), 0)
+        self.monitor.distilleries.add(self.distillery)
+        self.assertIn(self.distillery,
+                      self.monitor.date_capable_distilleries)
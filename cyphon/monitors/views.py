@@ -32,7 +32,7 @@ class MonitorViewSet(viewsets.ReadOnlyModelViewSet):
     """
     Read only viewset for Monitors.
     """
-    queryset = Monitor.objects.all()
+    queryset = Monitor.objects.prefetch_related('distilleries')
     serializer_class = MonitorSerializer
 
     @list_route(methods=['get'], url_path='enabled')
@@ -40,7 +40,8 @@ class MonitorViewSet(viewsets.ReadOnlyModelViewSet):
         """
         Returns a list of Monitors that are enabled.
         """
-        enabled_qs = Monitor.objects.find_enabled()
+        enabled_monitors = Monitor.objects.find_enabled()
+        enabled_qs = enabled_monitors.prefetch_related('distilleries')
         filtered_qs = self.filter_queryset(enabled_qs)
         page = self.paginate_queryset(filtered_qs)
 
@@ -36,6 +36,13 @@ MINUTES = 'm'
 HOURS = 'h'
 DAYS = 'd'
 
+_SECONDS_PER_UNIT = {
+    SECONDS: 1,
+    MINUTES: 60,
+    HOURS: 3600,
+    DAYS: 86400,
+}
+
 LOGGER = logging.getLogger(__name__)
 
 UTC_TZ = pytz.timezone('UTC')
@@ -171,14 +178,7 @@ def convert_time_to_seconds(time, unit):
     match a string defined by a constant (SECONDS, MINUTES, HOURS, or DAYS).
     The function returns the ceiling of the time in seconds.
     """
-    conversions = {
-        SECONDS: time,
-        MINUTES: convert_minutes_to_seconds(time),
-        HOURS: convert_hours_to_seconds(time),
-        DAYS: convert_days_to_seconds(time)
-    }
-
-    return conversions[unit]
+    return time * _SECONDS_PER_UNIT[unit]
 
 
 def convert_seconds(seconds):